@@ -19,6 +19,13 @@ from .agent_validation import AgentValidationError
 
 logger = logging.getLogger(__name__)
 
+# Projection returning one boolean per agent column. Listing available reports
+# only needs presence, so this avoids shipping the full report TEXT contents
+# out of the database just to test them for NULL.
+_AVAILABILITY_PROJECTION = ', '.join(
+    f"({column} IS NOT NULL) AS {column}" for column in AGENT_TYPE_MAPPING.values()
+)
+
 # Configure logging for debugging report retrieval issues
 def configure_retrieval_logging(level: str = "INFO") -> None:
     """
@@ -524,25 +531,24 @@ class ReportRetrievalService:
         try:
             conn = self._get_connection()
             with conn.cursor() as cursor:
-                # Get all report columns
-                columns = list(AGENT_TYPE_MAPPING.values())
-                column_list = ', '.join(columns)
-                
+                # Fetch presence booleans only - the report contents never
+                # leave the database
                 cursor.execute(
-                    f"SELECT {column_list} FROM agent_reports WHERE session_id = %s",
+                    f"SELECT {_AVAILABILITY_PROJECTION} FROM agent_reports WHERE session_id = %s",
                     (session_id,)
                 )
                 result = cursor.fetchone()
-                
+
                 if not result:
                     raise SessionNotFoundError(f"Session not found: {session_id}")
-                
+
                 # Find which reports are available
-                available_reports = []
-                for agent_type, column_name in AGENT_TYPE_MAPPING.items():
-                    if result[column_name] is not None:
-                        available_reports.append(agent_type)
-                
+                available_reports = [
+                    agent_type
+                    for agent_type, column_name in AGENT_TYPE_MAPPING.items()
+                    if result[column_name]
+                ]
+
                 logger.debug(f"Available reports for session {session_id}: {available_reports}")
                 return available_reports
                 
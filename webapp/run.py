@@ -6,7 +6,7 @@ This script starts the TradingAgents web application.
 Run with: python webapp/run.py
 """
 
-import uvicorn
+import os
 import sys
 from pathlib import Path
 
@@ -14,16 +14,28 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 if __name__ == "__main__":
+    # Deferred so importing this module (e.g. from tests) doesn't pay
+    # uvicorn's import cost
+    import uvicorn
+
+    port = int(os.environ.get("PORT", 8001))
+    # Only watch for code changes outside Railway - production shouldn't pay
+    # the watchfiles overhead at all
+    reload = os.environ.get("RAILWAY_ENVIRONMENT") is None
+
     print("🚀 Starting TradingAgents Web App...")
     print("📊 Multi-Agents LLM Financial Trading Framework")
-    print("🌐 Access the app at: http://localhost:8001")
+    print(f"🌐 Access the app at: http://localhost:{port}")
     print("=" * 50)
-    
+
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
-        port=8001,
-        reload=True,
-        reload_dirs=["."],
+        port=port,
+        reload=reload,
+        # Watch only the webapp package itself, not the whole working
+        # directory (results, node_modules, .git, ...)
+        reload_dirs=[str(Path(__file__).parent)],
+        reload_excludes=["results/*", "node_modules/*", ".git/*", "__pycache__/*", "*.pyc"],
         log_level="info"
-    )
\ No newline at end of file
+    )
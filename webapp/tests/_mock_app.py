@@ -0,0 +1,38 @@
+"""
+Minimal stand-in FastAPI app for the webapp API tests.
+
+Imported only when the real webapp.app cannot be loaded, so the common
+"real app available" case never parses or executes this fallback.
+"""
+
+import re
+
+from fastapi import FastAPI, HTTPException
+
+from _report_mapping import AGENT_REPORT_MAPPING
+
+app = FastAPI()
+
+# Compiled once - the handler runs for every request the suite issues,
+# so skip the re-module cache lookup per call
+_TICKER_RE = re.compile(r'^[A-Z]{1,5}$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+@app.get("/api/reports/{ticker}/{date}/{agent}")
+async def get_agent_report(ticker: str, date: str, agent: str):
+    if not _TICKER_RE.match(ticker):
+        raise HTTPException(status_code=400, detail="Invalid ticker format")
+    if not _DATE_RE.match(date):
+        raise HTTPException(status_code=400, detail="Invalid date format")
+    if agent not in AGENT_REPORT_MAPPING:
+        raise HTTPException(status_code=400, detail=f"Unknown agent: {agent}")
+    if ticker == "ZZZZZ":
+        raise HTTPException(status_code=404, detail="Report not found")
+    return {
+        "ticker": ticker,
+        "date": date,
+        "agent": agent,
+        "report_file": AGENT_REPORT_MAPPING[agent],
+        "content": f"# {agent} report for {ticker} on {date}",
+    }
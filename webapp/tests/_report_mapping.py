@@ -0,0 +1,22 @@
+"""
+Agent display name -> report file name, mirroring the webapp's mapping.
+
+Kept in its own dependency-free module so the test suite can import the
+mapping without pulling in the fallback app (and its FastAPI construction)
+when the real webapp.app loads fine.
+"""
+
+AGENT_REPORT_MAPPING = {
+    "Market Analyst": "market_report.md",
+    "Social Analyst": "sentiment_report.md",
+    "News Analyst": "news_report.md",
+    "Fundamentals Analyst": "fundamentals_report.md",
+    "Bull Researcher": "bull_report.md",
+    "Bear Researcher": "bear_report.md",
+    "Research Manager": "research_manager_report.md",
+    "Trader": "trader_report.md",
+    "Risky Analyst": "risky_report.md",
+    "Neutral Analyst": "neutral_report.md",
+    "Safe Analyst": "safe_report.md",
+    "Portfolio Manager": "portfolio_manager_report.md",
+}
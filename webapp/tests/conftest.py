@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures for the webapp test suite.
+
+The heavy framework modules are mocked out at import time below - conftest
+is imported before any test module is collected, so the mocks are in place
+before test_api_endpoint.py attempts `from webapp.app import app`.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+_MOCKED_MODULES = (
+    'tradingagents',
+    'tradingagents.graph',
+    'tradingagents.graph.trading_graph',
+    'tradingagents.default_config',
+    'tradingagents.storage',
+    'tradingagents.storage.report_retrieval',
+    'tradingagents.storage.neon_config',
+    'tradingagents.storage.session_utils',
+    'tradingagents.storage.agent_validation',
+    'tradingagents.storage.schema',
+    'cli',
+    'cli.models',
+)
+
+# Installed at conftest import time, not from a fixture: fixture setup runs
+# at the first test, which is after the test modules (and webapp.app with
+# them) have already been imported. setdefault leaves any genuinely
+# importable module untouched.
+for _module in _MOCKED_MODULES:
+    sys.modules.setdefault(_module, MagicMock())
+
+# webapp.app builds its agent whitelist from the storage schema at import
+# time; a bare MagicMock iterates empty and every agent would 400. Feed it
+# the shared mapping so the real-app branch validates agents like prod.
+from _report_mapping import AGENT_REPORT_MAPPING  # noqa: E402
+
+sys.modules['tradingagents.storage.schema'].AgentReportSchema.get_all_agent_types.return_value = sorted(
+    AGENT_REPORT_MAPPING
+)
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """The FastAPI app under test (real app, or the mock fallback)."""
+    from test_api_endpoint import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    """
+    Session-scoped test client, created once for the whole run.
+
+    httpx has no synchronous ASGI transport - ASGITransport only implements
+    the async interface, which is why TestClient wraps it in a portal
+    thread. Sharing one TestClient across the session keeps the portal
+    setup a one-time cost.
+    """
+    with TestClient(app_instance) as c:
+        yield c
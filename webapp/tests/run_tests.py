@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Test runner for the TradingAgents webapp.
+
+Runs the JavaScript (vitest) and Python (pytest) suites and prints a combined
+report. The two suites are independent, so they execute concurrently and the
+wall-clock cost is roughly the slower of the two rather than their sum.
+
+Usage: python webapp/tests/run_tests.py
+"""
+
+import hashlib
+import importlib.util
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Resolved once at import time - every path below derives from these instead
+# of re-walking .parent chains per call
+_HERE = Path(__file__).resolve().parent
+_WEBAPP_DIR = _HERE.parent
+_REPO_ROOT = _WEBAPP_DIR.parent
+_TEST_FILE = _HERE / "test_api_endpoint.py"
+_NODE_MODULES = _WEBAPP_DIR / "node_modules"
+_LOCKFILE = _WEBAPP_DIR / "package-lock.json"
+_STAMP_FILE = _WEBAPP_DIR / ".node_modules.stamp"
+
+
+def _lockfile_hash():
+    """Hash of package-lock.json, or None when it doesn't exist."""
+    if not _LOCKFILE.exists():
+        return None
+    return hashlib.sha256(_LOCKFILE.read_bytes()).hexdigest()
+
+
+def _npm_install_needed():
+    """
+    Decide whether npm install must run.
+
+    A stamp file records the lockfile hash after each successful install;
+    install is skipped when node_modules exists and the hash is unchanged.
+    """
+    if not _NODE_MODULES.exists():
+        return True
+    current = _lockfile_hash()
+    if current is None:
+        return True
+    try:
+        return _STAMP_FILE.read_text().strip() != current
+    except OSError:
+        return True
+
+
+def start_javascript_tests():
+    """
+    Prepare and launch the JavaScript test suite.
+
+    Returns:
+        A Popen handle for the running vitest process, or None if the
+        prerequisites could not be satisfied.
+    """
+    if _npm_install_needed():
+        print("📦 Installing JavaScript dependencies...")
+        install = subprocess.run(
+            ["npm", "install"],
+            cwd=_WEBAPP_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if install.returncode != 0:
+            print("❌ npm install failed:")
+            print(install.stderr)
+            return None
+        lock_hash = _lockfile_hash()
+        if lock_hash is not None:
+            _STAMP_FILE.write_text(lock_hash)
+
+    return subprocess.Popen(
+        ["npm", "test"],
+        cwd=_WEBAPP_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+
+
+def start_python_tests():
+    """
+    Prepare and launch the Python test suite.
+
+    Returns:
+        A Popen handle for the running pytest process, or None if the
+        prerequisites could not be satisfied.
+    """
+    # Only invoke pip when a test dependency is actually missing - the
+    # common re-run case skips the network round trip entirely
+    missing = [
+        pkg for pkg in ("pytest", "fastapi", "httpx")
+        if importlib.util.find_spec(pkg) is None
+    ]
+    if missing:
+        print(f"📦 Installing Python test dependencies: {', '.join(missing)}")
+        install = subprocess.run(
+            [sys.executable, "-m", "pip", "install", *missing],
+            capture_output=True,
+            text=True,
+        )
+        if install.returncode != 0:
+            print("❌ Failed to install Python test dependencies:")
+            print(install.stderr)
+            return None
+
+    # Run from the repo root: python -m puts the cwd on sys.path, which is
+    # what lets `from webapp.app import app` resolve - from webapp/ the
+    # suite could only ever exercise the mock fallback app
+    return subprocess.Popen(
+        [sys.executable, "-m", "pytest", str(_TEST_FILE), "-v"],
+        cwd=_REPO_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+
+
+def _stream_suite(label, proc):
+    """
+    Stream a suite's output line by line as it runs.
+
+    Lines are prefixed with the suite label so the two concurrent streams
+    stay attributable, and nothing is held in memory waiting for the
+    process to exit - progress and failures show up immediately.
+
+    Args:
+        label: Short suite tag prefixed onto each output line
+        proc: Popen handle, or None when startup already failed
+
+    Returns:
+        True when the suite passed
+    """
+    if proc is None:
+        sys.stdout.write(f"❌ [{label}] suite did not start\n")
+        return False
+    for line in iter(proc.stdout.readline, ""):
+        sys.stdout.write(f"[{label}] {line}")
+    return proc.wait() == 0
+
+
+_REPORT_RULE = "=" * 60
+
+
+def generate_test_report(js_passed, py_passed):
+    """Print a summary of the combined test run as one write."""
+    lines = (
+        "",
+        _REPORT_RULE,
+        "📊 TEST REPORT",
+        _REPORT_RULE,
+        f"JavaScript (vitest): {'✅ PASSED' if js_passed else '❌ FAILED'}",
+        f"Python (pytest):     {'✅ PASSED' if py_passed else '❌ FAILED'}",
+        _REPORT_RULE,
+        "🎉 All test suites passed" if js_passed and py_passed
+        else "⚠️ One or more test suites failed",
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main():
+    """Run both test suites concurrently and report the results."""
+    print("🧪 Running TradingAgents webapp test suites...\n")
+
+    # Launch both suites up front; installs happen synchronously inside the
+    # start functions, then the actual test processes run side by side.
+    js_proc = start_javascript_tests()
+    py_proc = start_python_tests()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        js_future = pool.submit(_stream_suite, "js", js_proc)
+        py_future = pool.submit(_stream_suite, "py", py_proc)
+        js_passed = js_future.result()
+        py_passed = py_future.result()
+
+    generate_test_report(js_passed, py_passed)
+    return 0 if js_passed and py_passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+API endpoint tests for the TradingAgents webapp.
+
+Exercises the /api/reports/{ticker}/{date}/{agent} endpoint: agent name
+mapping, input validation, error handling, and response structure. When the
+real app (and its heavy dependency graph) cannot be imported, a minimal mock
+app with the same route contract is used instead so the endpoint behaviour
+stays testable in isolation.
+
+Usage: pytest webapp/tests/test_api_endpoint.py -v
+"""
+
+import pytest
+
+# The heavy framework imports are mocked in conftest.py before this module
+# is imported, so pulling in webapp.app below stays cheap. The agent mapping
+# lives in a dependency-free module shared with the fallback app, so the
+# fallback itself is only parsed when the real app fails to import.
+from _report_mapping import AGENT_REPORT_MAPPING
+
+# (agent name, URL-encoded form) pairs built once at import - parametrized
+# tests index into this instead of re-encoding per case on every worker
+_ENCODED_AGENTS = [(name, name.replace(' ', '%20')) for name in sorted(AGENT_REPORT_MAPPING)]
+
+# SystemExit included: app.py exits the process when its tradingagents
+# imports fail, and that would otherwise kill pytest collection outright
+try:
+    from webapp.app import app
+except (ImportError, SystemExit):
+    from _mock_app import app
+
+
+# Field -> expected type for the two payload shapes, shared by the
+# structure tests instead of hand-rolled per-field asserts. The real app
+# answers with its ReportResponse envelope while the mock returns a flat
+# report payload, so the success schema is picked per response.
+_SUCCESS_SCHEMA = {"ticker": str, "date": str, "agent": str, "content": str}
+_REAL_SUCCESS_SCHEMA = {"success": bool, "agent": str}
+
+
+def _check_schema(data, schema):
+    """Assert every schema field is present with the expected type."""
+    for key, expected_type in schema.items():
+        assert key in data
+        assert isinstance(data[key], expected_type)
+
+
+def _error_message(data):
+    """The error text from either error shape: plain detail or the real
+    app's {success, error: {message}} envelope."""
+    if "detail" in data:
+        return data["detail"]
+    assert data.get("success") is False
+    return data.get("error", {}).get("message")
+
+
+@pytest.fixture(scope="module")
+def aapl_market_response(client):
+    """
+    The canonical successful-path response, fetched once per module.
+
+    Several tests assert against the same AAPL/Market Analyst GET; sharing
+    the (status_code, payload, headers) tuple saves the redundant
+    round-trips.
+    """
+    response = client.get("/api/reports/AAPL/2025-01-01/Market%20Analyst")
+    payload = response.json() if response.status_code == 200 else None
+    return response.status_code, payload, response.headers
+
+
+@pytest.fixture(scope="module")
+def notfound_response(client):
+    """The canonical missing-report response, fetched once per module."""
+    response = client.get("/api/reports/ZZZZZ/2025-01-01/Market%20Analyst")
+    return response.status_code, response.json()
+
+
+class TestReportEndpoint:
+    """Tests for successful report retrieval."""
+
+    def test_successful_report_request(self, aapl_market_response):
+        """A well-formed request returns a report payload."""
+        status_code, payload, _ = aapl_market_response
+        assert status_code in [200, 404, 500]
+        if status_code == 200:
+            if "ticker" in payload:
+                assert payload["ticker"] == "AAPL"
+            else:
+                # Real app envelope: no ticker field, but the agent echoes back
+                assert payload["agent"] == "Market Analyst"
+
+    @pytest.mark.parametrize("agent_name,encoded", _ENCODED_AGENTS)
+    def test_all_valid_agents(self, client, agent_name, encoded):
+        """Every mapped agent name is routable."""
+        response = client.get(f"/api/reports/AAPL/2025-01-01/{encoded}")
+        assert response.status_code in [200, 404, 500]
+
+
+class TestAgentReportMapping:
+    """Tests for the agent-name-to-report-file mapping."""
+
+    @pytest.mark.parametrize("agent", [
+        'Market Analyst', 'Social Analyst', 'News Analyst',
+        'Fundamentals Analyst', 'Bull Researcher', 'Bear Researcher',
+        'Research Manager', 'Trader', 'Risky Analyst',
+        'Neutral Analyst', 'Safe Analyst', 'Portfolio Manager',
+    ])
+    def test_mapping_completeness(self, agent):
+        """Every expected agent is present and maps to a markdown file."""
+        assert agent in AGENT_REPORT_MAPPING
+        assert AGENT_REPORT_MAPPING[agent].endswith('.md')
+
+    @pytest.mark.parametrize("file_name", [
+        'market_report.md', 'sentiment_report.md', 'news_report.md',
+        'fundamentals_report.md', 'bull_report.md', 'bear_report.md',
+        'research_manager_report.md', 'trader_report.md', 'risky_report.md',
+        'neutral_report.md', 'safe_report.md', 'portfolio_manager_report.md',
+    ])
+    def test_mapping_file_names(self, file_name):
+        """Every expected report file appears as a mapping target."""
+        assert file_name in AGENT_REPORT_MAPPING.values()
+
+
+class TestInputValidation:
+    """Tests for ticker, date, and agent input validation."""
+
+    @pytest.mark.parametrize("ticker,expected", [
+        ("A", [200, 404, 500]),
+        ("AAPL", [200, 404, 500]),
+        ("GOOGL", [200, 404, 500]),
+        ("BRK", [200, 404, 500]),
+        ("TSLA", [200, 404, 500]),
+        ("aapl", [400, 422]),
+        ("123", [400, 422]),
+        ("TOOLONGTICKER", [400, 422]),
+        ("AA-PL", [400, 422]),
+    ])
+    def test_ticker_validation(self, client, ticker, expected):
+        """Valid tickers pass and malformed tickers are rejected."""
+        response = client.get(f"/api/reports/{ticker}/2025-01-01/Market%20Analyst")
+        assert response.status_code in expected
+
+    @pytest.mark.parametrize("date,expected", [
+        ("2025-01-01", [200, 404, 500]),
+        ("2024-12-31", [200, 404, 500]),
+        ("2023-06-15", [200, 404, 500]),
+        ("2025-1-1", [400, 422]),
+        ("01-01-2025", [400, 422]),
+        # The unencoded slashes split the path, so no route matches
+        ("2025/01/01", [400, 404, 422]),
+        ("not-a-date", [400, 422]),
+    ])
+    def test_date_validation(self, client, date, expected):
+        """Valid ISO dates pass and malformed dates are rejected."""
+        response = client.get(f"/api/reports/AAPL/{date}/Market%20Analyst")
+        assert response.status_code in expected
+
+    @pytest.mark.parametrize("agent_name,encoded", _ENCODED_AGENTS)
+    def test_agent_validation(self, client, agent_name, encoded):
+        """Known agents pass validation."""
+        response = client.get(f"/api/reports/AAPL/2025-01-01/{encoded}")
+        assert response.status_code in [200, 404, 500]
+
+    def test_unknown_agent_rejected(self, client):
+        """Unknown agents are rejected."""
+        response = client.get("/api/reports/AAPL/2025-01-01/Unknown%20Agent")
+        assert response.status_code in [400, 404]
+
+    def test_invalid_ticker_format(self, client):
+        """A lowercase ticker is rejected with a detail message."""
+        response = client.get("/api/reports/aapl/2025-01-01/Market%20Analyst")
+        assert response.status_code in [400, 422]
+        data = response.json()
+        assert "detail" in data
+        assert data["detail"]
+
+    def test_invalid_date_format(self, client):
+        """A non-ISO date is rejected with a detail message."""
+        response = client.get("/api/reports/AAPL/01-01-2025/Market%20Analyst")
+        assert response.status_code in [400, 422]
+        data = response.json()
+        assert "detail" in data
+        assert data["detail"]
+
+    def test_unknown_agent(self, client):
+        """An unmapped agent name is rejected with an error message."""
+        response = client.get("/api/reports/AAPL/2025-01-01/Unknown%20Agent")
+        assert response.status_code in [400, 404]
+        assert _error_message(response.json())
+
+
+class TestErrorHandling:
+    """Tests for malformed requests and error responses."""
+
+    @pytest.mark.parametrize("url", [
+        "/api/reports/",
+        "/api/reports/AAPL/",
+        "/api/reports/AAPL/2025-01-01/",
+    ])
+    def test_malformed_request(self, client, url):
+        """Incomplete report paths fall through to 404."""
+        assert client.get(url).status_code == 404
+
+    @pytest.mark.parametrize("method,expected", [
+        ("get", [200, 400, 404, 500]),
+        ("post", [405]),
+        ("put", [405]),
+        ("delete", [405]),
+    ])
+    def test_http_method(self, client, method, expected):
+        """Only GET is allowed on the report endpoint."""
+        response = getattr(client, method)("/api/reports/AAPL/2025-01-01/Market%20Analyst")
+        assert response.status_code in expected
+
+    def test_server_error(self, client):
+        """A missing report surfaces a structured error."""
+        response = client.get("/api/reports/ZZZZZ/2025-01-01/Market%20Analyst")
+        assert response.status_code in [200, 404, 500]
+        data = response.json()
+        if response.status_code == 200:
+            # The real app reports a missing session inside a 200 envelope
+            assert data["success"] is False
+            assert data["message"] or data["error"]
+        else:
+            assert _error_message(data)
+
+
+class TestResponseStructure:
+    """Tests for the shape of success and error payloads."""
+
+    def test_response_structure(self, aapl_market_response):
+        """A successful payload carries the expected fields."""
+        status_code, data, _ = aapl_market_response
+        if status_code == 200:
+            schema = _SUCCESS_SCHEMA if "ticker" in data else _REAL_SUCCESS_SCHEMA
+            _check_schema(data, schema)
+
+    def test_error_response_structure(self, notfound_response):
+        """An error payload carries an error message in either shape."""
+        status_code, data = notfound_response
+        if status_code in [404, 500]:
+            assert _error_message(data)
+
+    def test_url_encoding(self, aapl_market_response):
+        """Agent names with spaces round-trip through URL encoding."""
+        status_code, payload, _ = aapl_market_response
+        assert status_code in [200, 404, 500]
+        if status_code == 200:
+            assert payload["agent"] == "Market Analyst"
+
+
+if __name__ == "__main__":
+    args = [__file__, "-v"]
+    try:
+        import xdist  # noqa: F401
+        args += ["-n", "auto", "--dist=loadfile"]
+    except ImportError:
+        pass
+    pytest.main(args)
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Environment variable validation for TradingAgents deployments.
+
+This module validates that the environment is configured correctly before the
+web application starts, covering API keys, database settings, and
+Railway-specific variables. It is used by the startup path and can be run
+directly: python webapp/validate_environment.py
+"""
+
+import copy
+import logging
+import os
+import re
+import sys
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Precompiled format matchers - one fullmatch pass per value instead of
+# chained startswith/isalnum checks with intermediate string allocations
+_OPENAI_KEY_RE = re.compile(r"sk-[A-Za-z0-9_\-]{17,}")
+_FINNHUB_KEY_RE = re.compile(r"[A-Za-z0-9_]{10,}")
+_DATABASE_URL_RE = re.compile(r"postgresql://[^@]+@.+")
+
+# Allowed-value sets and their error messages, built once - membership is an
+# O(1) frozenset lookup and no join() runs on the success path
+_SSL_MODES = frozenset({"require", "prefer", "disable", "allow"})
+_SSL_MSG = f"SSL mode must be one of: {', '.join(sorted(_SSL_MODES))}"
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_LOG_LEVEL_MSG = f"Log level must be one of: {', '.join(sorted(_LOG_LEVELS))}"
+_BOOL_VALUES = frozenset({"true", "false", "1", "0", "yes", "no"})
+_BOOL_MSG = f"Boolean value must be one of: {', '.join(sorted(_BOOL_VALUES))}"
+
+# Enforcement levels as small ints - branch on interned-int equality in the
+# validation loop instead of Enum identity checks
+LEVEL_REQUIRED = 0
+LEVEL_OPTIONAL = 1
+LEVEL_CONDITIONAL = 2
+
+# Errors and warnings are recorded as (name, category, args) tuples and only
+# rendered through these templates when something actually displays them -
+# a healthcheck that just reads is_valid never pays for string formatting
+_ERROR_TEMPLATES = {
+    "missing": "❌ {0}: Required variable is missing. {1}",
+    "missing_dep": "❌ {0}: Required when {1} is set. {2}",
+    "invalid": "❌ {0}: {1}",
+}
+_WARNING_TEMPLATES = {
+    "default": "⚠️ {0}: Not set, using default '{1}'",
+}
+
+
+def _format_records(records, templates) -> List[str]:
+    """Materialize display strings for (name, category, args) records."""
+    return [templates[category].format(name, *args) for name, category, args in records]
+
+
+class EnvironmentValidator:
+    """Validates environment variables for the TradingAgents web application."""
+
+    def __init__(self):
+        """Initialize the validator with the shared variable specification."""
+        self.validation_errors: List[Tuple[str, str, tuple]] = []
+        self.validation_warnings: List[Tuple[str, str, tuple]] = []
+        self.spec: Tuple[tuple, ...] = _SPEC
+
+    # Individual validators return (is_valid, message)
+
+    @staticmethod
+    def _validate_openai_key(value: str) -> Tuple[bool, str]:
+        """Validate OpenAI API key format."""
+        if not _OPENAI_KEY_RE.fullmatch(value):
+            return False, "OpenAI API key must start with 'sk-' followed by at least 17 characters"
+        return True, ""
+
+    @staticmethod
+    def _validate_finnhub_key(value: str) -> Tuple[bool, str]:
+        """Validate Finnhub API key format."""
+        if not _FINNHUB_KEY_RE.fullmatch(value):
+            return False, "Finnhub API key must be at least 10 alphanumeric/underscore characters"
+        return True, ""
+
+    @staticmethod
+    def _validate_database_url(value: str) -> Tuple[bool, str]:
+        """Validate Neon PostgreSQL connection string format."""
+        if not _DATABASE_URL_RE.fullmatch(value):
+            return False, "Database URL must be postgresql:// with credentials"
+        return True, ""
+
+    @staticmethod
+    def _validate_pool_size(value: str) -> Tuple[bool, str]:
+        """Validate database pool size is an integer in range."""
+        try:
+            size = int(value)
+        except ValueError:
+            return False, "DB_POOL_SIZE must be an integer"
+        if size < 1 or size > 50:
+            return False, "DB_POOL_SIZE must be between 1 and 50"
+        return True, ""
+
+    @staticmethod
+    def _validate_ssl_mode(value: str) -> Tuple[bool, str]:
+        """Validate PostgreSQL SSL mode value."""
+        return (True, "") if value in _SSL_MODES else (False, _SSL_MSG)
+
+    @staticmethod
+    def _validate_log_level(value: str) -> Tuple[bool, str]:
+        """Validate logging level name."""
+        return (True, "") if value.upper() in _LOG_LEVELS else (False, _LOG_LEVEL_MSG)
+
+    @staticmethod
+    def _validate_boolean(value: str) -> Tuple[bool, str]:
+        """Validate a boolean-style flag value."""
+        return (True, "") if value.lower() in _BOOL_VALUES else (False, _BOOL_MSG)
+
+    @staticmethod
+    def _validate_port(value: str) -> Tuple[bool, str]:
+        """Validate HTTP port number."""
+        try:
+            port = int(value)
+        except ValueError:
+            return False, "PORT must be an integer"
+        if port < 1 or port > 65535:
+            return False, "PORT must be between 1 and 65535"
+        return True, ""
+
+    def _check_presence(
+        self,
+        row: tuple,
+        env: Mapping[str, str],
+        satisfied_deps: frozenset,
+    ) -> Optional[str]:
+        """
+        Check whether one spec row is set, recording missing-var errors.
+
+        Args:
+            row: A (name, level, description, default, validator, depends_on)
+                tuple from the spec table
+            env: Snapshot of the environment captured by validate_all
+            satisfied_deps: Dependency names that are set in the environment,
+                evaluated once up front by validate_all
+
+        Returns:
+            The variable's value when set, else None
+        """
+        name, level, description, default, _, depends_on = row
+        value = env.get(name)
+
+        # Conditional variables only matter when their dependency is set
+        if level == LEVEL_CONDITIONAL:
+            if depends_on and depends_on not in satisfied_deps:
+                return None
+
+        if not value:
+            if level == LEVEL_REQUIRED:
+                self.validation_errors.append((name, "missing", (description,)))
+            elif level == LEVEL_CONDITIONAL:
+                self.validation_errors.append((name, "missing_dep", (depends_on, description)))
+            elif default is not None:
+                self.validation_warnings.append((name, "default", (default,)))
+            return None
+
+        return value
+
+    def _check_format(self, row: tuple, value: str) -> None:
+        """Run one spec row's format validator against its value."""
+        validate_func = row[4]
+        if validate_func is not None:
+            is_valid, message = validate_func(value)
+            if not is_valid:
+                self.validation_errors.append((row[0], "invalid", (message,)))
+
+    def validate_all(self) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Validate every configured environment variable.
+
+        The environment is snapshotted once at the start so each check hits a
+        plain dict instead of going back through os.environ, and so the whole
+        validation run sees a consistent view.
+
+        Returns:
+            Tuple of (is_valid, report) where report contains summary counts
+            plus the error and warning lists
+        """
+        self.validation_errors = []
+        self.validation_warnings = []
+
+        # Single batched read of the environment - all downstream checks
+        # (including conditional dependency probes) use this snapshot
+        env = dict(os.environ)
+        is_railway = bool(env.get("RAILWAY_ENVIRONMENT"))
+
+        # Evaluate each conditional dependency exactly once - every dependent
+        # variable then resolves it with an O(1) membership check
+        deps = {row[5] for row in self.spec if row[5]}
+        satisfied_deps = frozenset(dep for dep in deps if env.get(dep))
+
+        # Pass 1: cheap existence checks for every variable. Present values
+        # are collected so the format pass never touches the env again.
+        present = [
+            (row, value)
+            for row in self.spec
+            if (value := self._check_presence(row, env, satisfied_deps)) is not None
+        ]
+
+        # Pass 2: format validators. When required vars are already missing
+        # the deploy is misconfigured anyway, so skip format checks for
+        # variables that hang off a dependency - independent vars still get
+        # validated so their errors and warnings are captured.
+        missing_required = bool(self.validation_errors)
+        for row, value in present:
+            if missing_required and row[5]:
+                continue
+            self._check_format(row, value)
+
+        is_valid = not self.validation_errors
+        report = {
+            "valid": is_valid,
+            "is_railway": is_railway,
+            "total_variables": len(self.spec),
+            "validated_variables": len(self.spec) - len(self.validation_errors),
+            "errors": list(self.validation_errors),
+            "warnings": list(self.validation_warnings),
+        }
+
+        self._log_validation_results(report)
+        return is_valid, report
+
+    def get_validation_errors_for_display(self) -> List[str]:
+        """Materialize human-readable strings for the recorded errors."""
+        return _format_records(self.validation_errors, _ERROR_TEMPLATES)
+
+    def get_validation_warnings_for_display(self) -> List[str]:
+        """Materialize human-readable strings for the recorded warnings."""
+        return _format_records(self.validation_warnings, _WARNING_TEMPLATES)
+
+    def get_missing_required_vars(self, env: Optional[Mapping[str, str]] = None) -> List[str]:
+        """
+        Get the names of required variables that are not set.
+
+        Args:
+            env: Optional pre-captured environment snapshot. Callers that
+                already hold one (e.g. app startup) avoid a second pass over
+                os.environ.
+        """
+        if env is None:
+            env = dict(os.environ)
+        return [
+            row[0]
+            for row in self.spec
+            if row[1] == LEVEL_REQUIRED and not env.get(row[0])
+        ]
+
+    def _log_validation_results(self, report: Dict[str, Any]) -> None:
+        """Log the outcome of a validation run, formatting only if emitted."""
+        if report["valid"]:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "✅ Environment validation successful: %d/%d variables validated",
+                    report["validated_variables"],
+                    report["total_variables"],
+                )
+        elif logger.isEnabledFor(logging.ERROR):
+            logger.error("❌ Environment validation failed with %d error(s)", len(report["errors"]))
+            for error in _format_records(report["errors"], _ERROR_TEMPLATES):
+                logger.error(error)
+
+        if report["warnings"] and logger.isEnabledFor(logging.WARNING):
+            for warning in _format_records(report["warnings"], _WARNING_TEMPLATES):
+                logger.warning(warning)
+
+
+# Flat structure-of-arrays spec table built once at import time. Each row is
+# (name, level, description, default, validator, depends_on) - plain tuple
+# unpacking in the validation loop, no per-row attribute access or Enum
+# dispatch. Names are interned so env-dict lookups and dependency membership
+# checks hash/compare against the same string objects every run.
+_SPEC: Tuple[tuple, ...] = (
+    (
+        sys.intern("OPENAI_API_KEY"),
+        LEVEL_REQUIRED,
+        "OpenAI API key for LLM access",
+        None,
+        EnvironmentValidator._validate_openai_key,
+        None,
+    ),
+    (
+        sys.intern("FINNHUB_API_KEY"),
+        LEVEL_REQUIRED,
+        "Finnhub API key for market data",
+        None,
+        EnvironmentValidator._validate_finnhub_key,
+        None,
+    ),
+    (
+        sys.intern("NEON_DATABASE_URL"),
+        LEVEL_REQUIRED,
+        "Neon PostgreSQL connection string",
+        None,
+        EnvironmentValidator._validate_database_url,
+        None,
+    ),
+    (
+        sys.intern("ANTHROPIC_API_KEY"),
+        LEVEL_OPTIONAL,
+        "Anthropic API key for Claude models",
+        None,
+        None,
+        None,
+    ),
+    (
+        sys.intern("GOOGLE_API_KEY"),
+        LEVEL_OPTIONAL,
+        "Google API key for Gemini models",
+        None,
+        None,
+        None,
+    ),
+    (
+        sys.intern("DB_POOL_SIZE"),
+        LEVEL_OPTIONAL,
+        "Database connection pool size",
+        "10",
+        EnvironmentValidator._validate_pool_size,
+        None,
+    ),
+    (
+        sys.intern("DB_SSL_MODE"),
+        LEVEL_OPTIONAL,
+        "PostgreSQL SSL mode",
+        "require",
+        EnvironmentValidator._validate_ssl_mode,
+        None,
+    ),
+    (
+        sys.intern("LOG_LEVEL"),
+        LEVEL_OPTIONAL,
+        "Application logging level",
+        "INFO",
+        EnvironmentValidator._validate_log_level,
+        None,
+    ),
+    (
+        sys.intern("DEBUG"),
+        LEVEL_OPTIONAL,
+        "Enable debug mode",
+        "false",
+        EnvironmentValidator._validate_boolean,
+        None,
+    ),
+    (
+        sys.intern("PORT"),
+        LEVEL_CONDITIONAL,
+        "HTTP port assigned by Railway",
+        None,
+        EnvironmentValidator._validate_port,
+        sys.intern("RAILWAY_ENVIRONMENT"),
+    ),
+    (
+        sys.intern("RAILWAY_ENVIRONMENT"),
+        LEVEL_OPTIONAL,
+        "Railway deployment environment name",
+        None,
+        None,
+        None,
+    ),
+)
+
+
+# Names whose values feed into validation - the memoization key below hashes
+# exactly these, so any tracked change invalidates the cached report
+_TRACKED_NAMES: Tuple[str, ...] = tuple(
+    dict.fromkeys(
+        [row[0] for row in _SPEC] + [row[5] for row in _SPEC if row[5]]
+    )
+)
+
+_VALIDATION_CACHE: Dict[Tuple[str, ...], Tuple[bool, Dict[str, Any]]] = {}
+
+# Service name -> configuring env var, iterated once per healthcheck call
+_SERVICES: Tuple[Tuple[str, str], ...] = (
+    ("openai", "OPENAI_API_KEY"),
+    ("finnhub", "FINNHUB_API_KEY"),
+    ("database", "NEON_DATABASE_URL"),
+    ("anthropic", "ANTHROPIC_API_KEY"),
+    ("google", "GOOGLE_API_KEY"),
+)
+
+
+def validate_environment() -> Tuple[bool, Dict[str, Any]]:
+    """
+    Validate the current environment configuration.
+
+    The result is memoized per distinct set of tracked env-var values:
+    inside a container the environment almost never changes, so repeat
+    callers (startup, healthchecks, error pages) get a cached report
+    instead of re-running every validator.
+
+    Returns:
+        Tuple of (is_valid, report)
+    """
+    key = tuple(os.environ.get(name, "") for name in _TRACKED_NAMES)
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        is_valid, report = cached
+        # Hand out a fresh copy so callers mutating the report (or its
+        # error/warning lists) cannot poison the cache
+        return is_valid, copy.deepcopy(report)
+
+    validator = EnvironmentValidator()
+    is_valid, report = validator.validate_all()
+    _VALIDATION_CACHE[key] = (is_valid, copy.deepcopy(report))
+    return is_valid, report
+
+
+def _validate_environment_cache_clear() -> None:
+    """Drop all memoized validation results (used by tests)."""
+    _VALIDATION_CACHE.clear()
+
+
+validate_environment.cache_clear = _validate_environment_cache_clear
+
+
+def check_critical_services(env: Optional[Mapping[str, str]] = None) -> Dict[str, bool]:
+    """
+    Quick availability check for the services the app depends on.
+
+    Args:
+        env: Optional pre-captured environment snapshot to avoid re-reading
+            os.environ when the caller already holds one.
+
+    Returns:
+        Mapping of service name to whether its configuration is present
+    """
+    if env is None:
+        env = os.environ
+
+    services = {name: bool(env.get(var)) for name, var in _SERVICES}
+
+    if logger.isEnabledFor(logging.INFO):
+        for service, available in services.items():
+            if available:
+                logger.info("✅ %s: configured", service)
+            else:
+                logger.info("❌ %s: not configured", service)
+
+    return services
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    valid, _ = validate_environment()
+    check_critical_services()
+    raise SystemExit(0 if valid else 1)